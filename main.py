@@ -1,39 +1,168 @@
 import logging
 import asyncio
-from playwright.async_api import async_playwright
-from datetime import datetime
+import atexit
+import hashlib
+import json
+import os
+import queue
+import tempfile
+import time
+from logging.handlers import QueueHandler, QueueListener
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from datetime import date, datetime
+
+# Scheduling page the service checks
+SCHEDULING_URL = "https://care.425dental.com/schedule-appointments/?_gl=11eu87tj_gcl_auMTY4NjUyNjY2NC4xNzI2MjUyODIw_gaNzc0MzUzODQ3LjE3MjYyNTI4MjA._ga_P7N65JEY18*MTcyNjg2NDgzMi41LjEuMTcyNjg2NDkwMi4wLjAuMA.."
+
+# Maximum number of appointment checks running at once in check_many
+MAX_PARALLEL = 3
+
+# How long to wait for the booking popup before assuming a same-tab flow
+POPUP_TIMEOUT_MS = 5000
+
+# Seconds a scraped result stays valid in the cache
+CACHE_TTL = 30.0
+
+# Resources the scraper never reads; aborted to save bandwidth
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+# Cookies and local storage carried over between runs
+STATE_PATH = "state.json"
+
+# Map for appointment type buttons
+_SELECTOR_MAP = {
+    "New appointment": "div:has(> div.wpb_wrapper > h6:has-text('New Patient Exams')) ~ a",
+    "Emergency appointment": "div:has(> div.wpb_wrapper > h6:has-text('Emergency Appointments')) ~ a",
+    "Invisalign consultation": "div:has(> div.wpb_wrapper > h6:has-text('In-Office Invisalign Consultations')) ~ a",
+    "Virtual Invisalign consultation": "div:has(> div.wpb_wrapper > h6:has-text('Virtual Invisalign Consultations')) ~ a",
+}
+
+# Map for booking option titles
+_BOOKING_OPTION_MAP = {
+    "New appointment": "New Patient Exam - 60 min",
+    "Emergency appointment": "Emergency Appointment - 30 min",
+    "Invisalign consultation": "In-Office Invisalign Consultation - 60 min",
+    "Virtual Invisalign consultation": "Virtual Invisalign Consultation - 30 min",
+}
+
+# Walks the booking wizard in one call, waiting in-page for each step to render
+_SELECT_BOOKING_OPTION_SCRIPT = """async (titleText) => {
+    const waitFor = (find) => new Promise((resolve, reject) => {
+        const deadline = Date.now() + 10000;
+        const poll = () => {
+            const el = find();
+            if (el) return resolve(el);
+            if (Date.now() > deadline) return reject(new Error('Timed out waiting for booking step'));
+            setTimeout(poll, 50);
+        };
+        poll();
+    });
+    (await waitFor(() => document.querySelector('.ib-booking_select-box > span'))).click();
+    (await waitFor(() => document.querySelector('.ib-booking_center-footer a'))).click();
+    (await waitFor(() => document.querySelector('.ib-booking-option'))).click();
+    (await waitFor(() => [...document.querySelectorAll('.ib-booking-option-title')]
+        .find(e => e.textContent.includes(titleText)))).click();
+}"""
+
+# Snapshot of every active slot as [{date, time}, ...]
+_SNAPSHOT_SLOTS_SCRIPT = """() => Array.from(document.querySelectorAll("span.ib-booking-active"))
+    .map(e => ({date: e.getAttribute('time'), time: e.innerText}))"""
+
+# Pushes a fresh snapshot to window.onSlots whenever the rendered slots change
+_WATCH_SLOTS_SCRIPT = """() => {
+    const snapshotSlots = """ + _SNAPSHOT_SLOTS_SCRIPT + """;
+    let last = null;
+    const push = () => {
+        const slots = snapshotSlots();
+        const serialized = JSON.stringify(slots);
+        if (serialized === last) return;
+        last = serialized;
+        window.onSlots(slots);
+    };
+    // Only class and time feed the snapshot, so other attribute churn (hover, focus, animations) is ignored
+    new MutationObserver(push).observe(document.body, {
+        childList: true, subtree: true, attributes: true, attributeFilter: ['class', 'time']
+    });
+    push();
+}"""
+
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = ("January", "February", "March", "April", "May", "June",
+           "July", "August", "September", "October", "November", "December")
+
+# Background listener writing queued log records; started by _configure_logging
+_log_listener = None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str):
+    """Parse an ISO date string into ('Monday, September 30, 2024', date); many slots share a date."""
+    dt = datetime.fromisoformat(date_str)
+    formatted_date = f"{_WEEKDAYS[dt.weekday()]}, {_MONTHS[dt.month - 1]} {dt.day:02d}, {dt.year}"
+    return formatted_date, dt.date()
+
+
+def _configure_logging():
+    """Send log records through a queue so file and console writes happen off the event loop."""
+    global _log_listener
+    root = logging.getLogger()
+    if _log_listener is not None or root.handlers:
+        return
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler("scheduling_service.log"),  # Log to a file
+        logging.StreamHandler()  # Also log to console
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    _log_listener = QueueListener(log_queue, *handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # Flush queued records on exit
+
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
+
+def month_delta(current_y, current_m, target_y, target_m):
+    """Number of months from (current_y, current_m) to (target_y, target_m); negative if the target is earlier."""
+    return (target_y - current_y) * 12 + (target_m - current_m)
 
 
 class SchedulingService:
-    def __init__(self, url):
+    def __init__(self, url, cache_ttl=CACHE_TTL):
         self.url = url
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
         self.closed = True
-        self.state = {}
+        self.state = {}  # (appointment_type, date_preference) -> (timestamp, slots)
+        self.cache_ttl = cache_ttl
+        self._locks = {}  # key -> (lock, number of callers holding or waiting on it)
+        self._seen_errors = set()
+        self._same_tab_pages = set()  # Landing pages currently hosting a same-tab booking flow
 
         # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler("scheduling_service.log"),  # Log to a file
-                logging.StreamHandler()  # Also log to console
-            ]
-        )
+        _configure_logging()
     
-    def format_date(self, date):
-        """Formats the given date string to a human-readable format: 'Monday, September 30, 2024'."""
+    def parse_date(self, date_str):
+        """Parses a slot date string into its human-readable form and a date object."""
         try:
-            dt = datetime.fromisoformat(date)
-            formatted_date = dt.strftime('%A, %B %d, %Y')
-            return formatted_date
+            return _parse_date_cached(date_str)
         except ValueError:
-            logging.error(f"Invalid date format: {date}")
+            logging.error(f"Invalid date format: {date_str}")
             return None
 
+    def format_date(self, date_str):
+        """Formats the given date string to a human-readable format: 'Monday, September 30, 2024'."""
+        parsed = self.parse_date(date_str)
+        return parsed[0] if parsed else None
+
     def validate_date(self, date_preference):
         """Validates that the provided date preference is not in the past."""
         try:
@@ -41,23 +170,74 @@ class SchedulingService:
             preferred_date = datetime.strptime(date_preference, '%B %d, %Y')
 
             if preferred_date >= current_date:
-                # Extract month, day, and year for use in date picking
-                month = preferred_date.strftime('%B')
-                day = preferred_date.day
-                year = preferred_date.year
-                return month, day, year
+                return preferred_date.date()
             else:
                 return "Error: The preferred date is in the past."
         except ValueError:
             logging.error(f"Invalid date preference: {date_preference}")
             return "Error: Invalid date format."
 
+    async def save_error_screenshot(self, page, error, path):
+        """
+        Save a viewport JPEG of the page the first time each error type is seen at a location.
+        The error type is added to the file name, so every file matches the error it shows.
+        """
+        # Keyed on the type only: the message of e.g. a Playwright TimeoutError carries
+        # a call log with retry counts that differs between otherwise identical failures
+        error_name = type(error).__name__
+        error_hash = hashlib.blake2b(f"{path}:{error_name}".encode(), digest_size=8).hexdigest()
+        if error_hash in self._seen_errors:
+            return
+        self._seen_errors.add(error_hash)
+        root, ext = os.path.splitext(path)
+        await page.screenshot(path=f"{root}_{error_name}{ext}", type="jpeg", quality=60, full_page=False)
+
+    async def launch_browser(self, headless=True):
+        """Launch the shared browser once; later calls reuse the running instance."""
+        if self.browser is None:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=headless,
+                args=["--disable-dev-shm-usage", "--no-sandbox"]
+            )
+            self.closed = False
+        return self.browser
+
+    async def new_context(self):
+        """Create an isolated browser context on the shared browser."""
+        context = await self.browser.new_context(
+            viewport={'width': 1280, 'height': 800},
+            java_script_enabled=True,
+            storage_state=STATE_PATH if os.path.exists(STATE_PATH) else None
+        )
+        await context.route("**/*", self._block_unneeded_requests)
+        return context
+
+    async def _block_unneeded_requests(self, route):
+        """Abort images, fonts, media and analytics requests; let everything else through."""
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or "analytics" in request.url:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def save_storage_state(self, context):
+        """Persist the context's cookies and local storage for the next run."""
+        try:
+            storage_state = await context.storage_state()
+            # Write a temp file and swap it in so contexts starting up never read partial JSON
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(STATE_PATH)), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(storage_state, f)
+            os.replace(tmp_path, STATE_PATH)
+        except Exception as e:
+            logging.error(f"Error saving storage state - {e}")
+
     async def initialize_browser(self, headless=True):
         """Initialize Playwright and open the browser."""
         logging.info("Initializing browser...")
-        self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=headless, slow_mo=100)
-        self.context = await self.browser.new_context()
+        await self.launch_browser(headless=headless)
+        self.context = await self.new_context()
         self.page = await self.context.new_page()
         logging.info("Browser initialized.")
 
@@ -65,20 +245,31 @@ class SchedulingService:
         """Close the browser and Playwright session."""
         if not self.closed:
             logging.info("Closing browser...")
-            await self.page.close()
-            await self.browser.close()
-            await self.playwright.stop()
-            self.closed = True
+            try:
+                if self.context is not None:
+                    await self.save_storage_state(self.context)
+                if self.page is not None:
+                    await self.page.close()
+            finally:
+                # Always tear the session down so the Chromium process is not leaked
+                await self.browser.close()
+                await self.playwright.stop()
+                self.playwright = None
+                self.browser = None
+                self.context = None
+                self.page = None
+                self.closed = True
             logging.info("Browser closed.")
 
-    async def navigate_to_scheduling_page(self):
+    async def navigate_to_scheduling_page(self, page=None):
         """Navigate to the scheduling page URL and wait for the page to load."""
+        page = page or self.page
         logging.info(f"Navigating to {self.url}")
-        await self.page.goto(self.url)
-        await self.page.wait_for_load_state('networkidle')
+        await page.goto(self.url)
+        await page.wait_for_load_state('domcontentloaded')
         logging.info("Scheduling page loaded.")
 
-    async def select_appointment_type(self, appointment_type):
+    async def select_appointment_type(self, appointment_type, page=None):
         """
         Select the appointment type by clicking the respective button.
         Appointment Types:
@@ -86,150 +277,252 @@ class SchedulingService:
             2. Emergency appointment
             3. Invisalign consultation
         """
+        page = page or self.page
         logging.info(f"Selecting appointment type: {appointment_type}")
+        new_page = None
 
         try:
-            # Map for appointment type buttons
-            selector_map = {
-                "New appointment": "(//div[@class='wpb_wrapper']/h6[contains(text(), 'New Patient Exams')]/parent::*/parent::*/following-sibling::a)[1]",
-                "Emergency appointment": "(//div[@class='wpb_wrapper']/h6[contains(text(), 'Emergency Appointments')]/parent::*/parent::*/following-sibling::a)[1]",
-                "Invisalign consultation": "(//div[@class='wpb_wrapper']/h6[contains(text(), 'In-Office Invisalign Consultations')]/parent::*/parent::*/following-sibling::a)[1]",
-                "Virtual Invisalign consultation": "(//div[@class='wpb_wrapper']/h6[contains(text(), 'Virtual Invisalign Consultations')]/parent::*/parent::*/following-sibling::a)[1]",
-            }
-
-            # Map for booking option titles
-            booking_option_map = {
-                "New appointment": "New Patient Exam - 60 min",
-                "Emergency appointment": "Emergency Appointment - 30 min",
-                "Invisalign consultation": "In-Office Invisalign Consultation - 60 min",
-                "Virtual Invisalign consultation": "Virtual Invisalign Consultation - 30 min",
-            }
-
-            if appointment_type not in selector_map:
+            if appointment_type not in _SELECTOR_MAP:
                 logging.error(f"Unknown appointment type: {appointment_type}")
                 return
 
-            # Clicking the button to open the new tab for booking
-            async with self.page.context.expect_page() as new_tab_info:
-                await self.page.click(selector_map[appointment_type])
-            new_page = await new_tab_info.value
-            await new_page.wait_for_load_state('networkidle')
-
-            # Proceed with appointment type selection
-            await new_page.click("(//div[@class='ib-booking_select-box ']/span)[1]")
-            await new_page.click("(//div[@class='ib-booking_center-footer'])/a")
-            await new_page.click("(//div[@class='ib-booking-option '])[1]")
+            # Wait for the button first so the popup timeout only covers the tab opening
+            button = page.locator(_SELECTOR_MAP[appointment_type]).first
+            await button.wait_for(state="visible")
 
-            # Select appointment option based on type
-            appointment_option_text = booking_option_map[appointment_type]
-            booking_option_selector = f"//div[@class='ib-booking-option-title'][contains(text(), '{appointment_option_text}')]"
-            await new_page.click(booking_option_selector)
+            # Clicking the button to open the new tab for booking
+            clicked = False
+            try:
+                async with page.context.expect_page(timeout=POPUP_TIMEOUT_MS) as new_tab_info:
+                    await button.click()
+                    clicked = True
+                new_page = await new_tab_info.value
+            except PlaywrightTimeoutError:
+                if not clicked:
+                    # The click itself timed out; report it as a failure, not a same-tab flow
+                    raise
+                # No popup appeared; the booking flow continued in the same tab
+                logging.info("No booking tab opened, continuing on the current page.")
+                new_page = page
+                self._same_tab_pages.add(page)
+
+                async def close_late_popup(popup):
+                    # Only close a tab that opens while this same-tab flow is still active
+                    if page in self._same_tab_pages:
+                        logging.info("Closing booking tab that opened after the popup timeout.")
+                        await popup.close()
+
+                page.context.once("page", close_late_popup)
+            await new_page.wait_for_load_state('domcontentloaded')
+
+            # Proceed with appointment type selection and pick the option based on type
+            appointment_option_text = _BOOKING_OPTION_MAP[appointment_type]
+            await new_page.evaluate(_SELECT_BOOKING_OPTION_SCRIPT, appointment_option_text)
 
             logging.info(f"Successfully selected appointment option: {appointment_option_text}")
             return new_page
 
         except Exception as e:
             logging.error(f"Error selecting appointment type: {appointment_type} - {e}")
-            await self.page.screenshot(path=f"./errors/error_screenshot_{appointment_type}.png")
+            try:
+                await self.save_error_screenshot(page, e, f"./errors/error_screenshot_{appointment_type}.jpg")
+            finally:
+                # A failed same-tab flow leaves the landing page mid-wizard; reset it for the next check
+                if new_page is page:
+                    await self._reset_landing_page(page)
+
+    async def _reset_landing_page(self, page):
+        """Return a landing page used for a same-tab booking flow to the scheduling page."""
+        self._same_tab_pages.discard(page)
+        try:
+            await self.navigate_to_scheduling_page(page)
+        except Exception as e:
+            logging.error(f"Error resetting the scheduling page - {e}")
 
     async def get_available_slots(self, new_page):
-        """Fetch available appointment slots and return a list of slots."""
+        """Fetch available appointment slots and return a list of slots, or None if they could not be read."""
         logging.info("Fetching available appointment slots...")
         try:
-            ACTIVE_TIME_SLOTS = "//span[@class='ib-booking-active ']"
-            slots = await new_page.query_selector_all(ACTIVE_TIME_SLOTS)
-            available_slots = []
-            for slot in slots:
-                date = await slot.get_attribute('time')
-                time = await slot.inner_text()
-                formatted_date = self.format_date(date)
-                if formatted_date:
-                    available_slots.append({"date": formatted_date, "time": time})
-            return available_slots
+            # Read every active slot in a single round-trip to the browser
+            raw_slots = await new_page.evaluate(_SNAPSHOT_SLOTS_SCRIPT)
+            return self._build_slots(raw_slots)
 
         except Exception as e:
             logging.error(f"Error fetching available slots - {e}")
-            await self.page.screenshot(path="error_screenshot_slots.png")
-            return []
+            await self.save_error_screenshot(new_page, e, "error_screenshot_slots.jpg")
+            return None
+
+    def _build_slots(self, raw_slots):
+        """Turn raw {date, time} slot snapshots into formatted slots, skipping unparseable dates."""
+        available_slots = []
+        for slot in raw_slots:
+            parsed = self.parse_date(slot['date'])
+            if parsed:
+                formatted_date, slot_date = parsed
+                available_slots.append({"date": formatted_date, "time": slot['time'], "_date": slot_date})
+        return available_slots
+
+    async def watch_available_slots(self, appointment_type, on_slots, page=None):
+        """
+        Open the booking slots view once and push slot updates to on_slots as they render.
+        on_slots may be a function or a coroutine function taking the list of slots.
+        Returns the booking popup; close it to stop watching. Returns None if the
+        booking flow did not open a popup, since the landing page must stay usable.
+        """
+        page = page or self.page
+        logging.info(f"Watching available slots for {appointment_type}")
+        new_page = await self.select_appointment_type(appointment_type, page)
+        if new_page is None:
+            return None
+        if new_page is page:
+            logging.error(f"Cannot watch {appointment_type}: no booking tab opened")
+            await self._reset_landing_page(page)
+            return None
+
+        key = (appointment_type, None)
+
+        async def handle_slots(source, raw_slots):
+            available_slots = self._build_slots(raw_slots)
+            # Keep the cache warm so check_available_appointments can reuse pushed results.
+            # No lock: the assignment cannot interleave, and waiting on an in-flight check would stall the push
+            self.state[key] = (time.monotonic(), available_slots)
+            result = on_slots(available_slots)
+            if asyncio.iscoroutine(result):
+                await result
+
+        await new_page.expose_binding("onSlots", handle_slots)
+        await new_page.evaluate(_WATCH_SLOTS_SCRIPT)
+        return new_page
 
     async def set_date_preference(self, new_page, date_preference):
         """Set the preferred appointment date on the calendar."""
         logging.info(f"Setting date preference: {date_preference}")
         try:
-            validated_date = self.validate_date(date_preference)
-            if isinstance(validated_date, tuple):
-                month, day, year = validated_date
+            target_date = self.validate_date(date_preference)
+            if isinstance(target_date, date):
                 await new_page.click("//div[@class='react-datepicker__input-container']")
-                current_month = datetime.now().strftime('%B')
-                if current_month != month:
-                    await new_page.click("//button[contains(text(), 'Next Month')]")
+                # Page the datepicker from the month it actually shows to the preferred month
+                displayed_text = await new_page.locator('.react-datepicker__current-month').first.inner_text()
+                displayed = datetime.strptime(displayed_text.strip(), '%B %Y')
+                delta = month_delta(displayed.year, displayed.month, target_date.year, target_date.month)
+                if delta != 0:
+                    button_label = 'Next Month' if delta > 0 else 'Previous Month'
+                    logging.info(f"Datepicker shows {displayed_text.strip()}, clicking {button_label} {abs(delta)} time(s)")
+                    await new_page.evaluate(
+                        "([label, n]) => { for (let i = 0; i < n; i++) document.querySelector(`button[aria-label='${label}']`).click(); }",
+                        [button_label, abs(delta)]
+                    )
 
                 # Fetch available slots and filter by date preference
                 available_slots = await self.get_available_slots(new_page)
-                filtered_slots = [slot for slot in available_slots if date_preference in slot['date']]
+                if available_slots is None:
+                    return None
+                filtered_slots = [slot for slot in available_slots if slot['_date'] == target_date]
                 return filtered_slots
 
             else:
                 logging.error(f"Invalid date preference: {date_preference}")
         except Exception as e:
             logging.error(f"Error selecting date: {date_preference} - {e}")
-            await self.page.screenshot(path="error_screenshot_date.png")
+            await self.save_error_screenshot(new_page, e, "error_screenshot_date.jpg")
 
-    async def check_available_appointments(self, appointment_type, date_preference=None):
+    async def check_available_appointments(self, appointment_type, date_preference=None, page=None):
         """Main method to check for available appointments."""
         logging.info(f"Checking appointments for {appointment_type} with date preference: {date_preference}")
 
-        # Use cached results if available
-        if (appointment_type, date_preference) in self.state:
-            logging.info(f"Using cached results for {appointment_type} on {date_preference}")
-            return self.state[(appointment_type, date_preference)]
-    
-        # Capture the new page from the appointment type selection
-        new_page = await self.select_appointment_type(appointment_type)
-        if date_preference:
-            available_slots = await self.set_date_preference(new_page, date_preference)
-        else:
-            available_slots = await self.get_available_slots(new_page)
+        key = (appointment_type, date_preference)
+        self._evict_stale()
+        # Concurrent checks for the same key wait here and reuse the first scrape
+        async with self._key_lock(key):
+            # Use cached results if they are still fresh, otherwise drop them
+            if key in self.state:
+                timestamp, cached_slots = self.state[key]
+                if time.monotonic() - timestamp < self.cache_ttl:
+                    logging.info(f"Using cached results for {appointment_type} on {date_preference}")
+                    return cached_slots
+                del self.state[key]
+
+            # Capture the new page from the appointment type selection
+            page = page or self.page
+            new_page = await self.select_appointment_type(appointment_type, page)
+            if new_page is None:
+                return []
+            try:
+                if date_preference:
+                    available_slots = await self.set_date_preference(new_page, date_preference)
+                else:
+                    available_slots = await self.get_available_slots(new_page)
+            finally:
+                # Only the booking popup is per-check; the browser and landing page stay open
+                if new_page is not page:
+                    await new_page.close()
+                else:
+                    # Same-tab flow: return the landing page to the start for the next check
+                    await self._reset_landing_page(page)
+
+            # Cache successful scrapes only, so a transient failure is retried by the next caller
+            if available_slots is None:
+                return []
+            self.state[key] = (time.monotonic(), available_slots)
+            return available_slots
 
-        # Cache the results
-        self.state[(appointment_type, date_preference)] = available_slots
-        return available_slots
+    def _evict_stale(self):
+        """Drop expired cache entries."""
+        now = time.monotonic()
+        for key in [key for key, (timestamp, _) in self.state.items() if now - timestamp >= self.cache_ttl]:
+            del self.state[key]
+
+    @asynccontextmanager
+    async def _key_lock(self, key):
+        """Hold the lock for key; it is dropped once no caller holds or waits on it."""
+        lock, users = self._locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._locks[key]
+            if users == 1:
+                del self._locks[key]
+            else:
+                self._locks[key] = (lock, users - 1)
+
+    async def _check_one(self, semaphore, appointment_type, date_preference):
+        """Run a single appointment check in its own browser context."""
+        async with semaphore:
+            context = None
+            try:
+                context = await self.new_context()
+                page = await context.new_page()
+                await self.navigate_to_scheduling_page(page)
+                slots = await self.check_available_appointments(appointment_type, date_preference, page)
+                await self.save_storage_state(context)
+                return slots
+            except Exception as e:
+                # One failed check must not discard the results of the others
+                logging.error(f"Error checking {appointment_type} with date preference: {date_preference} - {e}")
+                return []
+            finally:
+                if context is not None:
+                    await context.close()
+
+    async def check_many(self, checks):
+        """
+        Check several (appointment_type, date_preference) pairs concurrently.
+        Each check gets an isolated context on the shared browser; at most
+        MAX_PARALLEL checks run at once. Results are returned in input order.
+        """
+        await self.launch_browser()
+        semaphore = asyncio.Semaphore(MAX_PARALLEL)
+        return await asyncio.gather(*[
+            self._check_one(semaphore, appointment_type, date_preference)
+            for appointment_type, date_preference in checks
+        ])
 
 
 # Usage example
-async def run_appointment_test(appointment_type, preferred_date, expected_slots_greater_than=0):
-    """
-    Run a test for checking available appointments for a given type and date.
-    
-    :param appointment_type: Type of the appointment (e.g., "New appointment", "Emergency appointment", etc.)
-    :param preferred_date: Date to check for appointments (can be None for no preference)
-    :param expected_slots_greater_than: Expected number of available slots (default 0)
-    """
-    url = "https://care.425dental.com/schedule-appointments/?_gl=11eu87tj_gcl_auMTY4NjUyNjY2NC4xNzI2MjUyODIw_gaNzc0MzUzODQ3LjE3MjYyNTI4MjA._ga_P7N65JEY18*MTcyNjg2NDgzMi41LjEuMTcyNjg2NDkwMi4wLjAuMA.."
-    scheduling_service = SchedulingService(url)
-
-    try:
-        await scheduling_service.initialize_browser(headless=False)  # Set to True for production
-        await scheduling_service.navigate_to_scheduling_page()
-        
-        # Example: Check for a new patient appointment on a specific date
-        appointment_type = "New appointment"
-        preferred_date = "October 02, 2024"
-        
-        # With Date preference
-        slots = await scheduling_service.check_available_appointments(appointment_type, preferred_date)
-         # Validate the number of slots
-        assert len(slots) >= expected_slots_greater_than, (
-            f"Expected at least {expected_slots_greater_than} slots, "
-            f"but found {len(slots)} for {appointment_type} on {preferred_date or 'any date'}"
-        )
-        print(f"Test for {appointment_type} on {preferred_date or 'any date'} - Available slots: {slots}")
-    
-    finally:
-        await scheduling_service.close_browser()
-
-
-
 async def test_all_appointment_types():
     test_cases = [
         # (appointment_type, preferred_date, expected_slots_greater_than)
@@ -246,8 +539,23 @@ async def test_all_appointment_types():
         ("Invisalign consultation", None, 1),
     ]
 
-    for appointment_type, preferred_date, expected_slots in test_cases:
-        await run_appointment_test(appointment_type, preferred_date, expected_slots)
+    scheduling_service = SchedulingService(SCHEDULING_URL)
+
+    try:
+        await scheduling_service.launch_browser(headless=False)  # Set to True for production
+        results = await scheduling_service.check_many(
+            [(appointment_type, preferred_date) for appointment_type, preferred_date, _ in test_cases]
+        )
+
+        for (appointment_type, preferred_date, expected_slots), slots in zip(test_cases, results):
+            assert len(slots) >= expected_slots, (
+                f"Expected at least {expected_slots} slots, "
+                f"but found {len(slots)} for {appointment_type} on {preferred_date or 'any date'}"
+            )
+            print(f"Test for {appointment_type} on {preferred_date or 'any date'} - Available slots: {slots}")
+
+    finally:
+        await scheduling_service.close_browser()
 
 
 